@@ -31,6 +31,16 @@ from src.core.logging import setup_logging, get_logger
 from src.services.scraper_service import ScraperService
 from src.core.config import settings
 
+try:
+    import uvloop
+except ImportError:  # Optional ('perf' extra, not available on Windows): default asyncio loop
+    uvloop = None
+
+
+def run_async(coro):
+    """asyncio.run() on uvloop when installed; scraping is I/O bound."""
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop if uvloop is not None else None)
+
 console = Console()
 
 # Setup logging before CLI initialization
@@ -85,6 +95,17 @@ def format_source_identifier(source: str) -> str:
             return f"{icon} {source}"
     return f"📌 {source}"
 
+def list_subdirectories(path: str) -> list:
+    """List visible subdirectory names (and symlinks to them) using os.scandir."""
+    import os
+    
+    try:
+        with os.scandir(path) as entries:
+            return [e.name for e in entries
+                    if e.is_dir() and not e.name.startswith('.')]
+    except FileNotFoundError:
+        return []
+
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.1.0")
@@ -250,62 +271,37 @@ def run_scraper(sources, limit, interactive):
                 total=total_posts_expected
             )
             
-            # Process sources one by one for real progress
-            all_results = {
-                "status": "success",
-                "posts_scraped": 0,
-                "models_found": set(),
-                "best_practices": 0,
-                "practices_extracted": 0,
-                "processing_time": 0,
-                "sources_processed": []
-            }
-            
             start_time = datetime.utcnow()
             
             if sources_list:
-                total_posts_processed = 0
+                # Sources run concurrently, so overall progress is the sum of each source's posts
+                posts_done_by_source = {}
                 
                 # Create progress callback
                 async def report_progress(source_name, posts_done, total_posts):
-                    nonlocal total_posts_processed
-                    current_progress = total_posts_processed + posts_done
-                    progress.update(task, completed=current_progress, 
+                    posts_done_by_source[source_name] = posts_done
+                    progress.update(task, completed=sum(posts_done_by_source.values()), 
                                   description=f"Processing {format_source_identifier(f'reddit:{source_name}')} [{posts_done}/{total_posts} posts]...")
                 
-                for idx, source in enumerate(sources_list):
-                    progress.update(task, description=f"Starting {format_source_identifier(source)}...")
-                    
-                    # Run scraper for single source with progress callback
-                    result = await service.run_scrapers(
-                        sources=[source],
-                        max_posts_per_source=limit,
-                        progress_callback=report_progress
-                    )
-                    
-                    # Aggregate results
-                    posts_found = result.get("posts_scraped", 0)
-                    all_results["posts_scraped"] += posts_found
-                    all_results["models_found"].update(result.get("models_found", []))
-                    all_results["best_practices"] += result.get("best_practices", 0)
-                    all_results["practices_extracted"] += result.get("best_practices", 0)  # Same as best_practices
-                    all_results["sources_processed"].append(source)
-                    
-                    # Update total posts processed
-                    total_posts_processed += min(posts_found, limit)
+                # One call for all sources so they share the MAX_CONCURRENT_SOURCES limit
+                all_results = await service.run_scrapers(
+                    sources=sources_list,
+                    max_posts_per_source=limit,
+                    progress_callback=report_progress
+                )
             else:
                 # Use default sources
-                result = await service.run_scrapers(
+                all_results = await service.run_scrapers(
                     sources=None,
                     max_posts_per_source=limit,
                 )
-                # Ensure result has all required fields
-                all_results = result
-                if "status" not in all_results:
-                    all_results["status"] = "success"
-                if "practices_extracted" not in all_results:
-                    all_results["practices_extracted"] = all_results.get("best_practices", 0)
-                progress.update(task, completed=total_posts_expected)
+            
+            # Ensure result has all required fields
+            if "status" not in all_results:
+                all_results["status"] = "success"
+            if "practices_extracted" not in all_results:
+                all_results["practices_extracted"] = all_results.get("best_practices", 0)
+            progress.update(task, completed=total_posts_expected)
             
             end_time = datetime.utcnow()
             all_results["processing_time"] = (end_time - start_time).total_seconds()
@@ -316,7 +312,7 @@ def run_scraper(sources, limit, interactive):
             
         display_scraper_result_enhanced(all_results)
     
-    asyncio.run(_run())
+    run_async(_run())
 
 
 @scrape.command(name="discover")
@@ -378,7 +374,7 @@ def discover_services(update, show_all):
         else:
             console.print("[yellow]No services discovered yet. Run with --update flag.[/yellow]")
     
-    asyncio.run(_discover())
+    run_async(_discover())
 
 
 @scrape.command(name="targeted")
@@ -399,8 +395,8 @@ def targeted_scrape(service, category, limit, priority, query_limit, parallel, d
         from src.scrapers.intelligent_browser_scraper import IntelligentBrowserScraper
         from src.services.batch_llm_processor import BatchLLMProcessor
         from src.services.llm_processor import LLMProcessorFactory
+        from src.utils.serialization import dumps
         from pathlib import Path
-        import json
         import asyncio
         from datetime import datetime
         
@@ -568,16 +564,16 @@ def targeted_scrape(service, category, limit, priority, query_limit, parallel, d
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = Path(f"data/intermediate/targeted_results_{timestamp}.json")
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'queries_run': len(queries),
-                'successful_queries': len(successful_queries),
-                'failed_queries': len(failed_queries),
-                'total_posts_scraped': sum(r.get('posts_found', 0) for r in all_results),
-                'results': all_llm_results,
-                'query_details': all_results
-            }, f, indent=2)
+        # Compact JSON - pretty-print with `python -m json.tool` when inspecting by hand
+        output_file.write_bytes(dumps({
+            'timestamp': datetime.now().isoformat(),
+            'queries_run': len(queries),
+            'successful_queries': len(successful_queries),
+            'failed_queries': len(failed_queries),
+            'total_posts_scraped': sum(r.get('posts_found', 0) for r in all_results),
+            'results': all_llm_results,
+            'query_details': all_results
+        }))
         
         # Calculate statistics
         total_problems = sum(len(r.get('problems', [])) for r in all_llm_results)
@@ -631,7 +627,7 @@ def targeted_scrape(service, category, limit, priority, query_limit, parallel, d
         await scraper.close()
         await llm.close()
     
-    asyncio.run(_targeted())
+    run_async(_targeted())
 
 
 @scrape.command(name="batch")
@@ -652,8 +648,8 @@ def batch_scrape(category, limit, priority, query_limit, batch_size, dry_run):
         from src.services.llm_processor import LLMProcessorFactory
         from src.services.model_entry_generator import ModelEntryGenerator
         from src.services.service_alias_manager import ServiceAliasManager
+        from src.utils.serialization import dumps
         from pathlib import Path
-        import json
         import asyncio
         from datetime import datetime
         
@@ -763,13 +759,13 @@ def batch_scrape(category, limit, priority, query_limit, batch_size, dry_run):
         output_file = Path(f"data/intermediate/batch_results_{timestamp}.json")
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'services_processed': services_to_process,
-                'total_queries': sum(len(queries_by_service[s]) for s in services_to_process),
-                'results': all_results
-            }, f, indent=2)
+        # Compact JSON - pretty-print with `python -m json.tool` when inspecting by hand
+        output_file.write_bytes(dumps({
+            'timestamp': datetime.now().isoformat(),
+            'services_processed': services_to_process,
+            'total_queries': sum(len(queries_by_service[s]) for s in services_to_process),
+            'results': all_results
+        }))
         
         # Generate model entries
         generator = ModelEntryGenerator()
@@ -790,7 +786,7 @@ def batch_scrape(category, limit, priority, query_limit, batch_size, dry_run):
         await scraper.close()
         await llm.close()
     
-    asyncio.run(_batch())
+    run_async(_batch())
 
 
 @scrape.command(name="all")
@@ -964,7 +960,7 @@ def scrape_status():
                 width=50
             ))
     
-    asyncio.run(_status())
+    run_async(_status())
 
 
 @cli.group()
@@ -996,8 +992,7 @@ def list_models(category, tree, cards):
     # Get all existing categories from the models directory
     all_categories = []
     if os.path.exists(models_dir):
-        all_categories = [d for d in os.listdir(models_dir) 
-                         if os.path.isdir(os.path.join(models_dir, d))]
+        all_categories = list_subdirectories(models_dir)
     
     # Use specified category or all found categories
     categories = all_categories if not category else [category]
@@ -1011,7 +1006,7 @@ def list_models(category, tree, cards):
             if os.path.exists(cat_dir):
                 cat_node = tree_view.add(f"[cyan]{cat}[/cyan]")
                 
-                model_list = [d for d in os.listdir(cat_dir) if os.path.isdir(os.path.join(cat_dir, d))]
+                model_list = list_subdirectories(cat_dir)
                 for model in sorted(model_list):
                     model_path = os.path.join(cat_dir, model)
                     files = os.listdir(model_path)
@@ -1026,7 +1021,7 @@ def list_models(category, tree, cards):
         for cat in categories:
             cat_dir = os.path.join(models_dir, cat)
             if os.path.exists(cat_dir):
-                model_list = [d for d in os.listdir(cat_dir) if os.path.isdir(os.path.join(cat_dir, d))]
+                model_list = list_subdirectories(cat_dir)
                 if model_list:
                     total_models += len(model_list)
                     
@@ -1076,7 +1071,7 @@ def list_models(category, tree, cards):
         for cat in categories:
             cat_dir = os.path.join(models_dir, cat)
             if os.path.exists(cat_dir):
-                model_list = [d for d in os.listdir(cat_dir) if os.path.isdir(os.path.join(cat_dir, d))]
+                model_list = list_subdirectories(cat_dir)
                 if model_list:
                     total_models += len(model_list)
                     
@@ -1124,7 +1119,11 @@ def model_info(model_id, category):
     import json
     
     model_path = os.path.join("models", category, model_id)
-    if not os.path.exists(model_path):
+    # One directory scan gives presence and sizes for every file
+    try:
+        with os.scandir(model_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
         console.print(f"[red]Model {model_id} not found in {category} category[/red]")
         return
     
@@ -1133,25 +1132,21 @@ def model_info(model_id, category):
     
     # Show files
     console.print("\n[bold]Available Content:[/bold]")
-    files = os.listdir(model_path)
-    for file in sorted(files):
-        file_path = os.path.join(model_path, file)
-        size = os.path.getsize(file_path)
-        console.print(f"  • {file} ({size:,} bytes)")
+    for name in sorted(entries):
+        size = entries[name].stat().st_size
+        console.print(f"  • {name} ({size:,} bytes)")
     
     # Show sample content
-    prompting_file = os.path.join(model_path, "prompting.md")
-    if os.path.exists(prompting_file):
+    if "prompting.md" in entries:
         console.print("\n[bold]Sample Prompting Content:[/bold]")
-        with open(prompting_file, 'r', encoding='utf-8') as f:
+        with open(entries["prompting.md"].path, 'r', encoding='utf-8') as f:
             content = f.read()
             preview = content[:300] + "..." if len(content) > 300 else content
             console.print(preview)
     
-    params_file = os.path.join(model_path, "parameters.json")
-    if os.path.exists(params_file):
+    if "parameters.json" in entries:
         console.print("\n[bold]Parameters:[/bold]")
-        with open(params_file, 'r', encoding='utf-8') as f:
+        with open(entries["parameters.json"].path, 'r', encoding='utf-8') as f:
             params = json.load(f)
             if isinstance(params, list) and len(params) > 0:
                 for param in params[:3]:  # Show first 3
@@ -1176,15 +1171,16 @@ def search_models(query, limit):
         return
     
     # Search through all categories and models dynamically
-    categories = [d for d in os.listdir(models_dir) if os.path.isdir(os.path.join(models_dir, d))]
-    for category in categories:
-        cat_dir = os.path.join(models_dir, category)
-        if os.path.exists(cat_dir):
-            for model in os.listdir(cat_dir):
-                if query.lower() in model.lower():
-                    results.append({"model": model, "category": category})
-                    if len(results) >= limit:
-                        break
+    query_lower = query.lower()
+    for category in list_subdirectories(models_dir):
+        for model in list_subdirectories(os.path.join(models_dir, category)):
+            if query_lower in model.lower():
+                results.append({"model": model, "category": category})
+                if len(results) >= limit:
+                    break
+        # Stop scanning remaining categories once we have enough results
+        if len(results) >= limit:
+            break
     
     if not results:
         console.print(f"[yellow]No models found for query: {query}[/yellow]")
@@ -1289,7 +1285,7 @@ def schedule():
         except KeyboardInterrupt:
             console.print("\n[yellow]Scheduled scraping stopped[/yellow]")
     
-    asyncio.run(_schedule())
+    run_async(_schedule())
 
 
 @cli.command()
@@ -1324,7 +1320,7 @@ def sources():
         console.print("  scapo scrape run -s reddit:LocalLLaMA -s reddit:OpenAI")
         console.print("  scapo scrape run --sources reddit:OpenAI --limit 5")
     
-    asyncio.run(_sources())
+    run_async(_sources())
 
 
 @cli.command()
@@ -31,6 +31,9 @@ class Settings(BaseSettings):
     scraping_delay_seconds: float = Field(
         default=2.0, description="Delay between scraping pages/posts (be respectful to servers)"
     )
+    max_concurrent_sources: int = Field(
+        default=3, ge=1, description="Sources scraped in parallel, each in its own browser page"
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
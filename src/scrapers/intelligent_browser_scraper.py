@@ -1,6 +1,7 @@
 """Intelligent browser-based scraper with LLM entity extraction."""
 
 import asyncio
+import hashlib
 import json
 import re
 from datetime import datetime
@@ -16,10 +17,14 @@ from src.core.models import ScrapedPost, SourceType
 from src.scrapers.browser_base import BrowserBaseScraper
 from src.services.llm_processor import LLMProcessorFactory
 from src.core.config import settings
+from src.utils.serialization import dumps
 
 
 logger = get_logger(__name__)
 
+# Model names too generic to get their own entry
+_GENERIC_MODEL_NAMES = frozenset({"general", "unknown", "ai", "llm"})
+
 
 @dataclass
 class ExtractedEntities:
@@ -31,6 +36,7 @@ class ExtractedEntities:
     is_ai_related: bool = False
     relevance_score: float = 0.0
     summary: str = ""
+    extraction_failed: bool = False  # LLM call or response parsing failed; worth retrying
 
 
 @dataclass
@@ -74,6 +80,7 @@ class IntelligentBrowserScraper(BrowserBaseScraper):
         self.processed_content: List[ProcessedContent] = []
         self.scrape_delay = settings.scraping_delay_seconds  # Use config value for polite delay
         self._llm_processor = None  # Cache the processor instance
+        self._seen_content: Set[bytes] = set()  # Digests of content already sent to the LLM
         
     async def fetch_posts(self, subreddit: Optional[str] = None, limit: int = 100, time_filter: str = "week") -> List[ScrapedPost]:
         """Required abstract method - handled by scrape_sources instead."""
@@ -83,6 +90,22 @@ class IntelligentBrowserScraper(BrowserBaseScraper):
         """Required abstract method - handled by LLM processing instead."""
         return {}
     
+    @staticmethod
+    def _content_key(content: str) -> bytes:
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    
+    def _mark_content_seen(self, content: str) -> bool:
+        """Record content as processed; returns False if identical content was seen before."""
+        key = self._content_key(content)
+        if key in self._seen_content:
+            return False
+        self._seen_content.add(key)
+        return True
+    
+    def _forget_content(self, content: str):
+        """Undo _mark_content_seen when processing the content didn't complete."""
+        self._seen_content.discard(self._content_key(content))
+    
     def _get_llm_processor(self):
         """Get or create a cached LLM processor instance."""
         if self._llm_processor is None:
@@ -171,7 +194,8 @@ IMPORTANT: Start your response with {{ and end with }}. No other text allowed.""
                     return ExtractedEntities(
                         is_ai_related=True,  # Assume it might be AI related
                         relevance_score=0.3,  # Low confidence
-                        summary="Could not parse LLM response"
+                        summary="Could not parse LLM response",
+                        extraction_failed=True
                     )
             
             return ExtractedEntities(
@@ -186,7 +210,7 @@ IMPORTANT: Start your response with {{ and end with }}. No other text allowed.""
                 
         except Exception as e:
             logger.error(f"Failed to extract entities: {e}")
-            return ExtractedEntities()
+            return ExtractedEntities(extraction_failed=True)
     
     async def extract_best_practices_with_llm(self, content: str, entities: ExtractedEntities) -> List[Dict[str, Any]]:
         """Extract best practices using LLM, guided by entities."""
@@ -490,27 +514,40 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
                 
                 await post_page.close()
                 
-                # Process with LLM - Step 1: Entity extraction
-                logger.info(f"Extracting entities from: {content_data['title'][:60]}...")
-                entities = await self.extract_entities_with_llm(content_data['fullContent'], f"reddit:{source_name}")
-                
-                if entities.is_ai_related:
-                    # Step 2: Extract best practices
-                    logger.info(f"AI content found (score: {entities.relevance_score}). Extracting practices...")
-                    practices = await self.extract_best_practices_with_llm(content_data['fullContent'], entities)
-                    
-                    processed.append(ProcessedContent(
-                        original_text=content_data['fullContent'],
-                        entities=entities,
-                        best_practices=practices,
-                        source_url=self.normalize_reddit_url(post['url']),
-                        source_type=f"reddit:{source_name}",
-                        timestamp=datetime.now().isoformat()
-                    ))
-                    
-                    logger.info(f"Extracted {len(practices)} practices from post")
+                if not self._mark_content_seen(content_data['fullContent']):
+                    # Cross-posts and re-scraped threads were already sent through the LLM
+                    logger.debug(f"Skipping duplicate content: {content_data['title'][:60]}")
                 else:
-                    logger.debug(f"Skipping non-AI content: {content_data['title'][:60]}")
+                    succeeded = False
+                    try:
+                        # Process with LLM - Step 1: Entity extraction
+                        logger.info(f"Extracting entities from: {content_data['title'][:60]}...")
+                        entities = await self.extract_entities_with_llm(content_data['fullContent'], f"reddit:{source_name}")
+                    
+                        if entities.is_ai_related:
+                            # Step 2: Extract best practices
+                            logger.info(f"AI content found (score: {entities.relevance_score}). Extracting practices...")
+                            practices = await self.extract_best_practices_with_llm(content_data['fullContent'], entities)
+                        
+                            processed.append(ProcessedContent(
+                                original_text=content_data['fullContent'],
+                                entities=entities,
+                                best_practices=practices,
+                                source_url=self.normalize_reddit_url(post['url']),
+                                source_type=f"reddit:{source_name}",
+                                timestamp=datetime.now().isoformat()
+                            ))
+                        
+                            logger.info(f"Extracted {len(practices)} practices from post")
+                            # Kept (even on a low-confidence parse fallback), so retrying would duplicate it
+                            succeeded = True
+                        else:
+                            logger.debug(f"Skipping non-AI content: {content_data['title'][:60]}")
+                            succeeded = not entities.extraction_failed
+                    finally:
+                        if not succeeded:
+                            # Nothing kept from a failed or interrupted post: leave it unseen so a later run retries it
+                            self._forget_content(content_data['fullContent'])
                 
                 # Report progress after processing this post
                 if progress_callback:
@@ -597,10 +634,6 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
     
     async def save_to_model_directories(self):
         """Save processed content using the ModelEntryGenerator for consistency with new pipeline."""
-        from src.services.model_entry_generator import ModelEntryGenerator
-        
-        generator = ModelEntryGenerator()
-        
         # Group practices by model/service
         model_data = {}
         
@@ -627,7 +660,7 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
                 models = practice.get("applicable_models", ["general"])
                 
                 # Skip if all models are generic
-                non_generic_models = [m for m in models if m.lower() not in ["general", "unknown", "ai", "llm"]]
+                non_generic_models = [m for m in models if m.lower() not in _GENERIC_MODEL_NAMES]
                 if not non_generic_models:
                     continue
                 
@@ -639,15 +672,36 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
                     logger.debug(f"Skipping low confidence practice: {confidence}")
                     continue
                 
-                # Add to each applicable model/service
-                for model in non_generic_models:
-                    clean_model = sanitize_model_name(model)
-                    if not clean_model:
-                        continue
+                # Convert practice to new format once - prioritize content field
+                content_text = practice.get("content", "")
+                details = practice.get("details", "")
+                tip = setting = problem = cost = None
+                
+                if content_text:
+                    details_lower = details.lower()
+                    # Add tip with details if available (avoid duplication)
+                    if details and details_lower != content_text.lower():
+                        # Only append details if it's different from content
+                        tip = f"{content_text} - {details}"
+                    else:
+                        tip = content_text
                     
+                    # Also add to settings if it looks like a parameter
+                    if details and any(k in details_lower for k in ["parameter", "setting", "config", "="]):
+                        setting = details
+                elif practice.get("problem") and practice.get("solution"):
+                    # Problem-solution format (fallback)
+                    problem = f"Problem: {practice.get('problem')}\nSolution: {practice.get('solution')}"
+                    cost = practice.get("savings_or_improvement")
+                
+                # Add to each applicable model/service once, even if several
+                # mentions sanitize to the same name
+                clean_models = dict.fromkeys(filter(None, map(sanitize_model_name, non_generic_models)))
+                for clean_model in clean_models:
                     # Initialize model data if needed
-                    if clean_model not in model_data:
-                        model_data[clean_model] = {
+                    entry = model_data.get(clean_model)
+                    if entry is None:
+                        entry = model_data[clean_model] = {
                             "service": clean_model,
                             "tips": [],
                             "problems": [],
@@ -655,32 +709,29 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
                             "cost_info": []
                         }
                     
-                    # Convert practice to new format - prioritize content field
-                    content_text = practice.get("content", "")
-                    details = practice.get("details", "")
-                    
-                    if content_text:
-                        # Add tip with details if available (avoid duplication)
-                        if details and details.lower() != content_text.lower():
-                            # Only append details if it's different from content
-                            model_data[clean_model]["tips"].append(f"{content_text} - {details}")
-                        else:
-                            model_data[clean_model]["tips"].append(content_text)
-                        
-                        # Also add to settings if it looks like a parameter
-                        if details and any(k in details.lower() for k in ["parameter", "setting", "config", "="]):
-                            model_data[clean_model]["settings"].append(details)
-                    elif practice.get("problem") and practice.get("solution"):
-                        # Problem-solution format (fallback)
-                        model_data[clean_model]["problems"].append(
-                            f"Problem: {practice.get('problem')}\nSolution: {practice.get('solution')}"
-                        )
-                        if practice.get("savings_or_improvement"):
-                            model_data[clean_model]["cost_info"].append(practice.get("savings_or_improvement"))
+                    if tip is not None:
+                        entry["tips"].append(tip)
+                    if setting is not None:
+                        entry["settings"].append(setting)
+                    if problem is not None:
+                        entry["problems"].append(problem)
+                        if cost:
+                            entry["cost_info"].append(cost)
                     
                     saved_count += 1
         
+        # Write entries in a worker thread so file I/O doesn't block the event loop
+        models_created = await asyncio.to_thread(self._create_model_entries, model_data)
+        
+        # Final summary
+        logger.info(f"Legacy scraping complete: {evaluated_count} practices processed, {models_created} models created")
+    
+    def _create_model_entries(self, model_data: Dict[str, Dict[str, Any]]) -> int:
+        """Create model entries for grouped practices (blocking file I/O)."""
+        from src.services.model_entry_generator import ModelEntryGenerator
+        
         # Save using ModelEntryGenerator for consistency
+        generator = ModelEntryGenerator()
         models_created = 0
         for model_name, extraction_data in model_data.items():
             # Skip if no data
@@ -698,9 +749,9 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
                     logger.warning(f"Failed to create model entry for {model_name}")
             except Exception as e:
                 logger.error(f"Error creating model entry for {model_name}: {e}")
+        generator.flush_updates()
         
-        # Final summary
-        logger.info(f"Legacy scraping complete: {evaluated_count} practices processed, {models_created} models created")
+        return models_created
     
 
     async def scrape_github_browser(self, page: Page, repo_path: str) -> List[ProcessedContent]:
@@ -746,13 +797,40 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
         
         return processed
     
-    async def scrape_sources(self, sources: List[str] = None, max_posts_per_source: int = 10, progress_callback=None):
+    async def _scrape_source(self, semaphore: asyncio.Semaphore, source: str, max_posts: int, progress_callback=None) -> List[ProcessedContent]:
+        """Scrape one source in its own page once a concurrency slot is free."""
+        async with semaphore:
+            page = await self.context.new_page()
+            try:
+                content = []
+                if source.startswith("reddit:"):
+                    subreddit = source.split(":", 1)[1]
+                    content = await self.scrape_reddit_browser(page, subreddit, max_posts, progress_callback)
+                    
+                # HackerNews not yet implemented
+                # elif source == "hackernews":
+                #     content = await self.scrape_hackernews_browser(page, max_posts)
+                    
+                elif source.startswith("github:"):
+                    repo = source.split(":", 1)[1]
+                    content = await self.scrape_github_browser(page, repo)
+                
+                logger.info(f"Completed scraping {source}")
+                return content
+            finally:
+                await page.close()
+
+    async def scrape_sources(self, sources: List[str] = None, max_posts_per_source: int = 10, progress_callback=None, max_concurrency: Optional[int] = None) -> Dict[str, str]:
         """Main entry point for scraping multiple sources.
         
         Args:
             sources: List of sources to scrape
             max_posts_per_source: Maximum posts per source
             progress_callback: Optional callback(source, posts_processed, total_posts) for progress updates
+            max_concurrency: Sources scraped at once (defaults to settings.max_concurrent_sources)
+        
+        Returns:
+            Error message for each source that failed, keyed by source
         """
         if sources is None:
             sources = ["reddit:LocalLLaMA", "reddit:OpenAI"]
@@ -760,25 +838,23 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
         await self.initialize_browser()
         
         try:
-            page = await self.context.new_page()
+            # Page loads and LLM calls are I/O bound, so overlap sources up to the limit
+            semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_sources)
+            results = await asyncio.gather(
+                *(self._scrape_source(semaphore, source, max_posts_per_source, progress_callback) for source in sources),
+                return_exceptions=True,
+            )
             
-            for source in sources:
-                if source.startswith("reddit:"):
-                    subreddit = source.split(":", 1)[1]
-                    content = await self.scrape_reddit_browser(page, subreddit, max_posts_per_source, progress_callback)
-                    self.processed_content.extend(content)
-                    
-                # HackerNews not yet implemented
-                # elif source == "hackernews":
-                #     content = await self.scrape_hackernews_browser(page, max_posts_per_source)
-                #     self.processed_content.extend(content)
-                    
-                elif source.startswith("github:"):
-                    repo = source.split(":", 1)[1]
-                    content = await self.scrape_github_browser(page, repo)
-                    self.processed_content.extend(content)
-                
-                logger.info(f"Completed scraping {source}")
+            # Keep content in source order; one failing source doesn't discard the others
+            errors = {}
+            for source, result in zip(sources, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to scrape {source}: {result}")
+                    errors[source] = str(result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self.processed_content.extend(result)
             
             # Save all processed content
             await self.save_to_model_directories()
@@ -807,8 +883,9 @@ IMPORTANT: Start with {{ and end with }}. Be strict - only high-quality, model-s
             # Save summary in data directory
             summary_file = Path("data") / "intelligent_scraper_summary.json"
             summary_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(summary_file, "w") as f:
-                json.dump(summary, f, indent=2)
+            summary_file.write_bytes(dumps(summary, indent=True))
+            
+            return errors
                 
         finally:
             await self.close_browser()
@@ -11,9 +11,56 @@ from datetime import datetime
 from abc import ABC, abstractmethod
 import logging
 
+from src.utils.fileio import atomic_write_bytes
+
 logger = logging.getLogger(__name__)
 
 
+def _keyword_re(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one pattern that matches if any of them is a substring"""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
+
+
+# (category, service-name keywords, name-or-description keywords) in priority order
+_CATEGORY_RULES = (
+    # Video - very specific keywords
+    ('video',
+     _keyword_re(['synthesia', 'heygen', 'runway', 'pika', 'pictory', 'fliki',
+                  'invideo', 'luma', 'kaiber', 'genmo', 'hour one', 'deepbrain',
+                  'colossyan', 'elai', 'steve.ai', 'rephrase', 'd-id']),
+     _keyword_re(['video', 'animation', 'motion graphics', 'movie', 'film', 'footage'])),
+    # Audio - specific audio keywords
+    ('audio',
+     _keyword_re(['elevenlabs', 'eleven labs', 'murf', 'play.ht', 'wellsaid',
+                  'resemble', 'descript', 'overdub', 'respeecher', 'sonantic']),
+     _keyword_re(['audio', 'voice', 'speech', 'music', 'sound', 'tts', 'text-to-speech',
+                  'voice synthesis', 'voice clone', 'podcast', 'transcription'])),
+    # Image - specific image keywords
+    ('image',
+     _keyword_re(['dall-e', 'midjourney', 'stable diffusion', 'leonardo', 'ideogram',
+                  'dreamstudio', 'nightcafe', 'artbreeder', 'deep dream']),
+     _keyword_re(['image', 'picture', 'photo', 'art', 'drawing', 'illustration',
+                  'graphic', 'visual', 'paint', 'design', 'artwork'])),
+    # Code - programming specific
+    ('code',
+     _keyword_re(['copilot', 'codeium', 'cursor', 'tabnine', 'codex', 'replit']),
+     _keyword_re(['code', 'programming', 'developer', 'ide', 'compiler', 'debugger',
+                  'repository', 'github', 'coding assistant'])),
+    # Multimodal - handles multiple modalities
+    ('multimodal',
+     None,
+     _keyword_re(['multimodal', 'vision', 'multi-modal', 'image and text',
+                  'vision language', 'vlm', 'visual language'])),
+)
+
+# Text/LLM - language models and text generation
+_TEXT_TO_X_RE = _keyword_re(['text-to-video', 'text-to-image', 'text-to-speech', 'text-to-audio'])
+_TEXT_NAMES_RE = _keyword_re(['openai', 'anthropic', 'claude', 'gpt', 'mistral', 'llama',
+                              'gemini', 'palm', 'character.ai', 'replika'])
+_TEXT_STRONG_RE = _keyword_re(['llm', 'language model', 'chatbot', 'chat assistant', 'gpt',
+                               'claude', 'writing assistant', 'text generation', 'conversation'])
+
+
 class ServiceDiscoverySource(ABC):
     """Abstract base class for service discovery sources"""
     
@@ -187,69 +234,21 @@ class GitHubAwesomeListSource(ServiceDiscoverySource):
     def _infer_category(self, name: str, description: str) -> str:
         """Infer service category from name and description"""
         name_lower = name.lower()
-        desc_lower = description.lower()
         combined = (name + ' ' + description).lower()
         
-        # Priority-based categorization with weighted keywords
-        # Check for most specific categories first
-        
-        # Video - very specific keywords
-        video_strong = ['video', 'animation', 'motion graphics', 'movie', 'film', 'footage']
-        video_names = ['synthesia', 'heygen', 'runway', 'pika', 'pictory', 'fliki', 
-                      'invideo', 'luma', 'kaiber', 'genmo', 'hour one', 'deepbrain',
-                      'colossyan', 'elai', 'steve.ai', 'rephrase', 'd-id']
-        if any(kw in name_lower for kw in video_names):
-            return 'video'
-        if any(kw in combined for kw in video_strong):
-            return 'video'
-        
-        # Audio - specific audio keywords
-        audio_strong = ['audio', 'voice', 'speech', 'music', 'sound', 'tts', 'text-to-speech',
-                       'voice synthesis', 'voice clone', 'podcast', 'transcription']
-        audio_names = ['elevenlabs', 'eleven labs', 'murf', 'play.ht', 'wellsaid', 
-                      'resemble', 'descript', 'overdub', 'respeecher', 'sonantic']
-        if any(kw in name_lower for kw in audio_names):
-            return 'audio'
-        if any(kw in combined for kw in audio_strong):
-            return 'audio'
-        
-        # Image - specific image keywords
-        image_strong = ['image', 'picture', 'photo', 'art', 'drawing', 'illustration',
-                       'graphic', 'visual', 'paint', 'design', 'artwork']
-        image_names = ['dall-e', 'midjourney', 'stable diffusion', 'leonardo', 'ideogram',
-                      'dreamstudio', 'nightcafe', 'artbreeder', 'deep dream']
-        if any(kw in name_lower for kw in image_names):
-            return 'image'
-        if any(kw in combined for kw in image_strong):
-            return 'image'
-        
-        # Code - programming specific
-        code_strong = ['code', 'programming', 'developer', 'ide', 'compiler', 'debugger',
-                      'repository', 'github', 'coding assistant']
-        code_names = ['copilot', 'codeium', 'cursor', 'tabnine', 'codex', 'replit']
-        if any(kw in name_lower for kw in code_names):
-            return 'code'
-        if any(kw in combined for kw in code_strong):
-            return 'code'
-        
-        # Multimodal - handles multiple modalities
-        multimodal_keywords = ['multimodal', 'vision', 'multi-modal', 'image and text',
-                              'vision language', 'vlm', 'visual language']
-        if any(kw in combined for kw in multimodal_keywords):
-            return 'multimodal'
+        # Priority-based categorization: most specific categories first
+        for category, name_re, keyword_re in _CATEGORY_RULES:
+            if name_re is not None and name_re.search(name_lower):
+                return category
+            if keyword_re.search(combined):
+                return category
         
-        # Text/LLM - language models and text generation
-        # Check this AFTER more specific categories to avoid false positives
-        text_strong = ['llm', 'language model', 'chatbot', 'chat assistant', 'gpt', 
-                      'claude', 'writing assistant', 'text generation', 'conversation']
-        text_names = ['openai', 'anthropic', 'claude', 'gpt', 'mistral', 'llama',
-                     'gemini', 'palm', 'character.ai', 'replika']
+        # Text/LLM - checked AFTER more specific categories to avoid false positives
         # Exclude if it's clearly about text-to-X conversion
-        if not any(pattern in combined for pattern in ['text-to-video', 'text-to-image', 
-                                                       'text-to-speech', 'text-to-audio']):
-            if any(kw in name_lower for kw in text_names):
+        if not _TEXT_TO_X_RE.search(combined):
+            if _TEXT_NAMES_RE.search(name_lower):
                 return 'text'
-            if any(kw in combined for kw in text_strong):
+            if _TEXT_STRONG_RE.search(combined):
                 return 'text'
         
         return 'general'
@@ -295,8 +294,7 @@ class ServiceRegistry:
             'aliases': self.aliases,
             'last_updated': datetime.now().isoformat()
         }
-        with open(self.registry_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        atomic_write_bytes(self.registry_path, json.dumps(data, indent=2).encode('utf-8'))
     
     def add_service(self, service_data: Dict) -> str:
         """
@@ -1,8 +1,10 @@
 """Source manager for handling all scraping sources."""
 
+import copy
+import os
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
 from src.core.logging import get_logger
@@ -10,6 +12,9 @@ from src.core.models import SourceType
 
 logger = get_logger(__name__)
 
+# Parsed sources files, copied into each SourceManager instance: path -> (mtime_ns, config)
+_config_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
 
 class SourceManager:
     """Manages all scraping sources and their configurations."""
@@ -18,19 +23,52 @@ class SourceManager:
         if sources_file is None:
             # Get the path relative to this file
             sources_file = Path(__file__).parent / "sources.yaml"
-        self.sources_file = sources_file
+        self.sources_file = Path(sources_file)
+        self._mtime: Optional[int] = None
         self.sources_config = self._load_sources()
+        self._by_priority = self._index_by_priority()
         self.last_scraped: Dict[str, datetime] = {}
     
     def _load_sources(self) -> Dict[str, Any]:
-        """Load sources configuration from YAML file."""
+        """Load sources configuration from YAML file (parsed once per file version)."""
         try:
-            with open(self.sources_file, "r") as f:
-                return yaml.safe_load(f)
+            mtime = os.stat(self.sources_file).st_mtime_ns
+            cached = _config_cache.get(self.sources_file)
+            if cached is not None and cached[0] == mtime:
+                config = cached[1]
+            else:
+                with open(self.sources_file, "r") as f:
+                    config = yaml.safe_load(f)
+                _config_cache[self.sources_file] = (mtime, config)
+            self._mtime = mtime
+            # Instances tag and hand out these dicts, so never share the cached ones
+            return copy.deepcopy(config)
         except Exception as e:
             logger.error(f"Failed to load sources config: {e}")
             return {}
     
+    def reload_if_changed(self) -> bool:
+        """Reload the sources file if it was modified since it was loaded."""
+        try:
+            mtime = os.stat(self.sources_file).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self.sources_config = self._load_sources()
+        self._by_priority = self._index_by_priority()
+        return True
+    
+    def _index_by_priority(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Group all sources by priority in one pass, tagging each with its source type."""
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for source_type in ["reddit", "github", "forums", "apis", "discord", "rss_feeds", "news_aggregators"]:
+            config = self.sources_config.get(source_type, {})
+            for source in config.get("sources", []):
+                source["source_type"] = source_type
+                index.setdefault(source.get("priority"), []).append(source)
+        return index
+    
     def get_reddit_sources(self) -> List[Dict[str, Any]]:
         """Get all Reddit sources."""
         reddit_config = self.sources_config.get("reddit", {})
@@ -68,18 +106,7 @@ class SourceManager:
     
     def get_sources_by_priority(self, priority: str = "high") -> List[Dict[str, Any]]:
         """Get all sources filtered by priority."""
-        all_sources = []
-        
-        # Collect from all source types
-        for source_type in ["reddit", "github", "forums", "apis", "discord", "rss_feeds", "news_aggregators"]:
-            config = self.sources_config.get(source_type, {})
-            sources = config.get("sources", [])
-            for source in sources:
-                if source.get("priority") == priority:
-                    source["source_type"] = source_type
-                    all_sources.append(source)
-        
-        return all_sources
+        return list(self._by_priority.get(priority, ()))
     
     def get_sources_for_model(self, model_id: str) -> List[Dict[str, Any]]:
         """Get sources relevant to a specific model."""
@@ -9,6 +9,7 @@ from datetime import datetime
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from src.services.service_alias_manager import ServiceAliasManager
+from src.utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -279,8 +280,7 @@ class TargetedSearchGenerator:
             'summary': self._generate_summary(queries)
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        Path(output_path).write_bytes(dumps(data, indent=True))
         
         logger.info(f"Saved {len(queries)} queries to {output_path}")
     
@@ -6,6 +6,7 @@ import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 import hashlib
 
 from src.core.logging import get_logger
@@ -30,6 +31,11 @@ class ContentChunk:
     def chunk_id(self) -> str:
         """Generate unique ID for this chunk."""
         return hashlib.md5(f"{self.start_pos}:{self.end_pos}".encode()).hexdigest()[:8]
+    
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased text, computed once and reused for every entity lookup."""
+        return self.text.lower()
 
 
 class ContentChunker:
@@ -349,9 +355,10 @@ Return as JSON array of practices:
         seen_contents = set()
         
         for practice in practices:
-            content_hash = hashlib.md5(practice.get('content', '').encode()).hexdigest()
-            if content_hash not in seen_contents:
-                seen_contents.add(content_hash)
+            # Dedup is in-memory only, so the string itself is the key - no digest needed
+            content = practice.get('content', '')
+            if content not in seen_contents:
+                seen_contents.add(content)
                 unique_practices.append(practice)
         
         # Could add additional validation here
@@ -371,14 +378,8 @@ Return as JSON array of practices:
     
     def _find_relevant_chunks(self, chunks: List[ContentChunk], entity: str) -> List[ContentChunk]:
         """Find chunks that mention a specific entity."""
-        relevant = []
         entity_lower = entity.lower()
-        
-        for chunk in chunks:
-            if entity_lower in chunk.text.lower():
-                relevant.append(chunk)
-        
-        return relevant
+        return [chunk for chunk in chunks if entity_lower in chunk.text_lower]
     
     def _extract_themes(self, practices: List[Dict]) -> set:
         """Extract common themes from practices."""
@@ -1,16 +1,91 @@
 """
 Model Entry Generator - Creates structured documentation in the models folder
 """
-import json
+import functools
 import os
+import re
+import string
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 from src.services.update_manager import UpdateManager
+from src.utils.fileio import atomic_write_bytes
+from src.utils.serialization import dumps, loads
+
+try:
+    import ijson
+except ImportError:  # Optional: only needed to stream very large result files
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Bump when the generated file layout changes so existing entries get rewritten
+ENTRY_FORMAT_VERSION = "1.0.0"
+
+# Result files at or above this size are streamed instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Deletes every ASCII character that isn't allowed in a folder name
+_NAME_KEEP = set(string.ascii_lowercase + string.digits + '-')
+_NAME_STRIP_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _NAME_KEEP))
+
+# Attribution listed in every parameters.json
+_PARAMETER_SOURCES = ("Reddit community", "User reports")
+
+# Setting classifiers for parameters.json
+_BREAK_TAG_RE = re.compile(r'^(?=.*break)(?=.*tag)', re.IGNORECASE | re.DOTALL)
+_SPEECH_RATE_RE = re.compile(r'speech rate|slower', re.IGNORECASE)
+
+# Pitfall buckets, checked in order (substring match, like the original keyword lists)
+_TECHNICAL_ISSUE_RE = re.compile(r'api|stutter|error|bug|crash|slow', re.IGNORECASE)
+_POLICY_ISSUE_RE = re.compile(r'policy|account|ban|disable|misuse|trial', re.IGNORECASE)
+_COST_ISSUE_RE = re.compile(r'credit|cost|expensive|limit', re.IGNORECASE)
+_MONEY_TIP_RE = re.compile(r'save|cheap|free|cost|price|credit|limit|tier|plan', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _categorize(service_name: str) -> str:
+    """Resolve a service's category (cached - services.json doesn't change mid-run)"""
+    from src.services.service_alias_manager import ServiceAliasManager
+    
+    # Use alias manager for better matching
+    alias_manager = ServiceAliasManager()
+    service_match = alias_manager.match_service(service_name)
+    
+    category = 'general'
+    if service_match:
+        category = service_match.get('category', 'general')
+    
+    # If category is 'general', try to determine it from known keywords
+    if category == 'general':
+        service_name_lower = service_name.lower()
+        if any(keyword in service_name_lower for keyword in ['midjourney', 'dall-e', 'stable diffusion', 'leonardo', 'ideogram']):
+            category = 'image'
+        elif any(keyword in service_name_lower for keyword in ['runway', 'pika', 'luma', 'kaiber', 'genmo', 'haiper']):
+            category = 'video'
+        elif any(keyword in service_name_lower for keyword in ['elevenlabs', 'eleven labs', 'murf', 'play.ht', 'wellsaid', 'descript']):
+            category = 'audio'
+        elif any(keyword in service_name_lower for keyword in ['gpt', 'claude', 'llama', 'gemini', 'mistral']):
+            category = 'text'
+        elif any(keyword in service_name_lower for keyword in ['copilot', 'cursor', 'codeium', 'tabnine']):
+            category = 'code'
+    
+    return category
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize(service_name: str) -> str:
+    """Normalize a service name for file/folder naming (cached)"""
+    # Remove special characters and spaces
+    normalized = service_name.lower()
+    normalized = normalized.replace(' ', '-')
+    if normalized.isascii():
+        return normalized.translate(_NAME_STRIP_TABLE)
+    # Non-ASCII names keep unicode letters/digits
+    normalized = ''.join(c for c in normalized if c.isalnum() or c == '-')
+    return normalized
+
 
 class ModelEntryGenerator:
     """Generates structured model documentation from extracted tips"""
@@ -19,6 +94,8 @@ class ModelEntryGenerator:
         self.models_root = models_root
         self.ensure_directory_structure()
         self.update_manager = UpdateManager(models_root)
+        # Updates are recorded in memory and written to the update log by flush_updates()
+        self._pending_updates: List[tuple] = []
     
     def ensure_directory_structure(self):
         """Ensure the models root directory exists"""
@@ -28,113 +105,105 @@ class ModelEntryGenerator:
     
     def categorize_service(self, service_name: str) -> str:
         """Get category from services.json using ServiceAliasManager"""
-        from src.services.service_alias_manager import ServiceAliasManager
-        
-        # Use alias manager for better matching
-        alias_manager = ServiceAliasManager()
-        service_match = alias_manager.match_service(service_name)
-        
-        category = 'general'
-        if service_match:
-            category = service_match.get('category', 'general')
-        
-        # If category is 'general', try to determine it from known keywords
-        if category == 'general':
-            service_name_lower = service_name.lower()
-            if any(keyword in service_name_lower for keyword in ['midjourney', 'dall-e', 'stable diffusion', 'leonardo', 'ideogram']):
-                category = 'image'
-            elif any(keyword in service_name_lower for keyword in ['runway', 'pika', 'luma', 'kaiber', 'genmo', 'haiper']):
-                category = 'video'
-            elif any(keyword in service_name_lower for keyword in ['elevenlabs', 'eleven labs', 'murf', 'play.ht', 'wellsaid', 'descript']):
-                category = 'audio'
-            elif any(keyword in service_name_lower for keyword in ['gpt', 'claude', 'llama', 'gemini', 'mistral']):
-                category = 'text'
-            elif any(keyword in service_name_lower for keyword in ['copilot', 'cursor', 'codeium', 'tabnine']):
-                category = 'code'
-        
-        return category
+        return _categorize(service_name)
     
     def normalize_service_name(self, service_name: str) -> str:
         """Normalize service name for file/folder naming"""
-        # Remove special characters and spaces
-        normalized = service_name.lower()
-        normalized = normalized.replace(' ', '-')
-        normalized = ''.join(c for c in normalized if c.isalnum() or c == '-')
-        return normalized
+        return _normalize(service_name)
     
-    def generate_prompting_md(self, service_name: str, tips: List[str], settings: List[str]) -> str:
+    def generate_prompting_md(self, service_name: str, tips: List[str], settings: List[str],
+                              now: Optional[datetime] = None) -> str:
         """Generate prompting.md content - focused on HOW to use the service effectively"""
-        content = f"# {service_name} Prompting Guide\n\n"
-        content += f"*Last updated: {datetime.now().strftime('%Y-%m-%d')}*\n\n"
+        now = now or datetime.now()
+        parts = [
+            f"# {service_name} Prompting Guide\n\n",
+            f"*Last updated: {now.strftime('%Y-%m-%d')}*\n\n",
+        ]
         
         # Don't filter tips - include all extracted tips like the current pipeline does
         # The LLM already filtered for relevance during extraction
         if tips:
-            content += "## Tips & Techniques\n\n"
-            for tip in tips:
-                content += f"- {tip}\n"
-            content += "\n"
+            parts.append("## Tips & Techniques\n\n")
+            parts.extend(f"- {tip}\n" for tip in tips)
+            parts.append("\n")
         
         if settings:
-            content += "## Recommended Settings\n\n"
-            for setting in settings:
-                content += f"- {setting}\n"
-            content += "\n"
+            parts.append("## Recommended Settings\n\n")
+            parts.extend(f"- {setting}\n" for setting in settings)
+            parts.append("\n")
         
         # Only add if we have actual content
         if not (tips or settings):
-            content += "*No specific prompting tips available yet. Check back for updates.*\n\n"
+            parts.append("*No specific prompting tips available yet. Check back for updates.*\n\n")
         
-        content += "## Sources\n\n"
-        content += "- Reddit community discussions\n"
-        content += "- User-reported experiences\n"
+        parts.append("## Sources\n\n"
+                     "- Reddit community discussions\n"
+                     "- User-reported experiences\n")
         
-        return content
+        return "".join(parts)
     
-    def generate_parameters_json(self, service_name: str, settings: List[str], cost_info: List[str]) -> Dict:
+    def generate_parameters_json(self, service_name: str, settings: List[str], cost_info: List[str],
+                                 now: Optional[datetime] = None) -> Dict:
         """Generate parameters.json content"""
+        now = now or datetime.now()
         parameters = {
             "service": service_name,
-            "last_updated": datetime.now().isoformat(),
-            "recommended_settings": {},
-            "cost_optimization": {},
-            "sources": ["Reddit community", "User reports"]
+            "last_updated": now.isoformat(),
         }
+        if not settings and not cost_info:
+            parameters["sources"] = _PARAMETER_SOURCES
+            return parameters
         
         # Parse settings into structured format
+        recommended_settings = {}
+        setting_idx = 0
         for setting in settings:
-            if "break" in setting.lower() and "tag" in setting.lower():
-                parameters["recommended_settings"]["speech_pauses"] = {
+            if _BREAK_TAG_RE.match(setting):
+                recommended_settings["speech_pauses"] = {
                     "description": setting,
                     "value": "<break time=\"1.5s\" />"
                 }
-            elif "speech rate" in setting.lower() or "slower" in setting.lower():
-                parameters["recommended_settings"]["speech_rate"] = {
+            elif _SPEECH_RATE_RE.search(setting):
+                recommended_settings["speech_rate"] = {
                     "description": setting,
                     "value": "slower_preferred"
                 }
             else:
                 # Generic setting
-                key = f"setting_{len(parameters['recommended_settings'])}"
-                parameters["recommended_settings"][key] = {
+                recommended_settings[f"setting_{setting_idx}"] = {
                     "description": setting
                 }
+                setting_idx += 1
         
         # Add cost information
+        cost_optimization = {}
+        tip_idx = 0
         for cost in cost_info:
             if "$" in cost:
-                parameters["cost_optimization"]["pricing"] = cost
+                cost_optimization["pricing"] = cost
             elif "unlimited" in cost.lower():
-                parameters["cost_optimization"]["unlimited_option"] = cost
+                cost_optimization["unlimited_option"] = cost
             else:
-                parameters["cost_optimization"][f"tip_{len(parameters['cost_optimization'])}"] = cost
+                cost_optimization[f"tip_{tip_idx}"] = cost
+                tip_idx += 1
+        
+        # Only attach sections that have content
+        if recommended_settings:
+            parameters["recommended_settings"] = recommended_settings
+        if cost_optimization:
+            parameters["cost_optimization"] = cost_optimization
+        parameters["sources"] = _PARAMETER_SOURCES
         
         return parameters
     
-    def generate_pitfalls_md(self, service_name: str, problems: List[str], cost_info: List[str]) -> str:
+    def generate_pitfalls_md(self, service_name: str, problems: List[str], cost_info: List[str],
+                             now: Optional[datetime] = None) -> str:
         """Generate pitfalls.md content - focused on what to AVOID"""
-        content = f"# {service_name} - Common Pitfalls & Issues\n\n"
-        content += f"*Last updated: {datetime.now().strftime('%Y-%m-%d')}*\n\n"
+        now = now or datetime.now()
+        parts = [
+            f"# {service_name} - Common Pitfalls & Issues\n\n",
+            f"*Last updated: {now.strftime('%Y-%m-%d')}*\n\n",
+        ]
         
         # Categorize problems
         technical_issues = []
@@ -142,91 +211,118 @@ class ModelEntryGenerator:
         cost_issues = []
         
         for problem in problems:
-            problem_lower = problem.lower()
-            if any(keyword in problem_lower for keyword in ['api', 'stutter', 'error', 'bug', 'crash', 'slow']):
+            if _TECHNICAL_ISSUE_RE.search(problem):
                 technical_issues.append(problem)
-            elif any(keyword in problem_lower for keyword in ['policy', 'account', 'ban', 'disable', 'misuse', 'trial']):
+            elif _POLICY_ISSUE_RE.search(problem):
                 policy_issues.append(problem)
-            elif any(keyword in problem_lower for keyword in ['credit', 'cost', 'expensive', 'limit']):
+            elif _COST_ISSUE_RE.search(problem):
                 cost_issues.append(problem)
         
         # Add cost info to cost issues if relevant
         for info in cost_info:
-            if 'limit' in info.lower() or 'character' in info.lower():
+            info_lower = info.lower()
+            if 'limit' in info_lower or 'character' in info_lower:
                 cost_issues.append(info)
         
         if technical_issues:
-            content += "## Technical Issues\n\n"
+            parts.append("## Technical Issues\n\n")
             for issue in technical_issues:
-                content += f"### ⚠️ {issue}\n"
+                parts.append(f"### ⚠️ {issue}\n")
                 # Add specific solutions
-                if "stutter" in issue.lower():
-                    content += "**Fix**: Keep speech rate adjustments under 5%. Record slower initially rather than slowing down in post.\n\n"
-                elif "api key" in issue.lower():
-                    content += "**Fix**: Store API keys in environment variables or use a secrets manager.\n\n"
+                issue_lower = issue.lower()
+                if "stutter" in issue_lower:
+                    parts.append("**Fix**: Keep speech rate adjustments under 5%. Record slower initially rather than slowing down in post.\n\n")
+                elif "api key" in issue_lower:
+                    parts.append("**Fix**: Store API keys in environment variables or use a secrets manager.\n\n")
                 else:
-                    content += "\n"
+                    parts.append("\n")
         
         if policy_issues:
-            content += "## Policy & Account Issues\n\n"
+            parts.append("## Policy & Account Issues\n\n")
             for issue in policy_issues:
-                content += f"### ⚠️ {issue}\n"
-                if "trial" in issue.lower() or "account" in issue.lower():
-                    content += "**Note**: Be aware of terms of service regarding account creation.\n\n"
+                parts.append(f"### ⚠️ {issue}\n")
+                issue_lower = issue.lower()
+                if "trial" in issue_lower or "account" in issue_lower:
+                    parts.append("**Note**: Be aware of terms of service regarding account creation.\n\n")
                 else:
-                    content += "\n"
+                    parts.append("\n")
         
         if cost_issues:
-            content += "## Cost & Limits\n\n"
-            for issue in cost_issues:
-                content += f"### 💰 {issue}\n\n"
+            parts.append("## Cost & Limits\n\n")
+            parts.extend(f"### 💰 {issue}\n\n" for issue in cost_issues)
         
         if not (technical_issues or policy_issues or cost_issues):
-            content += "*No major issues reported yet. This may indicate limited community data.*\n\n"
+            parts.append("*No major issues reported yet. This may indicate limited community data.*\n\n")
         
-        return content
+        return "".join(parts)
     
-    def generate_cost_optimization_md(self, service_name: str, cost_info: List[str], tips: List[str]) -> str:
+    def generate_cost_optimization_md(self, service_name: str, cost_info: List[str], tips: List[str],
+                                      now: Optional[datetime] = None) -> str:
         """Generate cost_optimization.md - focused on saving money"""
-        content = f"# {service_name} - Cost Optimization Guide\n\n"
-        content += f"*Last updated: {datetime.now().strftime('%Y-%m-%d')}*\n\n"
+        now = now or datetime.now()
+        parts = [
+            f"# {service_name} - Cost Optimization Guide\n\n",
+            f"*Last updated: {now.strftime('%Y-%m-%d')}*\n\n",
+        ]
         
         # Include all cost info without filtering - LLM already filtered
         if cost_info:
-            content += "## Cost & Pricing Information\n\n"
-            for info in cost_info:
-                content += f"- {info}\n"
-            content += "\n"
+            parts.append("## Cost & Pricing Information\n\n")
+            parts.extend(f"- {info}\n" for info in cost_info)
+            parts.append("\n")
         
         # Include money-saving tips from the tips list
-        money_tips = [tip for tip in tips if any(
-            keyword in tip.lower() for keyword in 
-            ['save', 'cheap', 'free', 'cost', 'price', 'credit', 'limit', 'tier', 'plan']
-        )]
+        money_tips = [tip for tip in tips if _MONEY_TIP_RE.search(tip)]
         
         if money_tips:
-            content += "## Money-Saving Tips\n\n"
-            for tip in money_tips:
-                content += f"- {tip}\n"
-            content += "\n"
+            parts.append("## Money-Saving Tips\n\n")
+            parts.extend(f"- {tip}\n" for tip in money_tips)
+            parts.append("\n")
         
         if not (cost_info or money_tips):
-            content += "*No cost optimization information available yet.*\n\n"
+            parts.append("*No cost optimization information available yet.*\n\n")
         
-        return content
+        return "".join(parts)
     
-    def generate_metadata_json(self, service_name: str, extraction_data: Dict) -> Dict:
+    def generate_metadata_json(self, service_name: str, extraction_data: Dict, content_hash: Optional[str] = None,
+                               now: Optional[datetime] = None) -> Dict:
         """Generate metadata.json"""
-        return {
+        timestamp = (now or datetime.now()).isoformat()
+        metadata = {
             "service": service_name,
             "category": self.categorize_service(service_name),
-            "last_updated": datetime.now().isoformat(),
-            "extraction_timestamp": extraction_data.get('timestamp', datetime.now().isoformat()),
+            "last_updated": timestamp,
+            "extraction_timestamp": extraction_data.get('timestamp', timestamp),
             "data_sources": ["Reddit API", "Community discussions"],
             "posts_analyzed": extraction_data.get('batch_size', 0),
             "confidence": "medium",  # Could be calculated based on number of corroborating posts
-            "version": "1.0.0"
+            "version": ENTRY_FORMAT_VERSION
         }
+        if content_hash:
+            metadata["content_hash"] = content_hash
+        return metadata
+    
+    def is_entry_unchanged(self, model_dir: Path, content_hash: str) -> bool:
+        """Check whether an existing entry was generated from the same content"""
+        try:
+            existing = loads((model_dir / "metadata.json").read_bytes())
+        except (OSError, ValueError):
+            return False
+        return (existing.get("content_hash") == content_hash
+                and existing.get("version") == ENTRY_FORMAT_VERSION)
+    
+    def write_files_atomically(self, model_dir: Path, files: Dict[str, bytes]):
+        """Write each file via atomic_write_bytes, syncing the directory once"""
+        for name, payload in files.items():
+            atomic_write_bytes(model_dir / name, payload)
+        
+        # One fsync of the directory makes all renames durable (POSIX only)
+        if hasattr(os, 'O_DIRECTORY'):
+            fd = os.open(model_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
     
     def create_model_entry(self, extraction: Dict) -> bool:
         """Create a complete model entry from extraction data"""
@@ -251,52 +347,58 @@ class ModelEntryGenerator:
             category = self.categorize_service(service_name)
             normalized_name = self.normalize_service_name(service_name)
             model_dir = self.models_root / category / normalized_name
+            
+            # Skip the rewrite entirely when nothing changed since the last run
+            content_hash = self.update_manager.calculate_content_hash({
+                'tips': tips,
+                'problems': problems,
+                'cost_info': cost_info,
+                'settings': settings
+            })
+            if self.is_entry_unchanged(model_dir, content_hash):
+                logger.info(f"No changes for {service_name}, keeping existing entry")
+                return True
+            
             model_dir.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Creating model entry for {service_name} in {category}/{normalized_name}")
             
-            # Generate and save files
-            files_created = []
+            # Generate all payloads first, then swap them in together
+            files: Dict[str, bytes] = {}
+            now = datetime.now()  # One timestamp shared by every file in the entry
             
             # prompting.md - focus on usage tips and settings
             if tips or settings:
-                prompting_content = self.generate_prompting_md(service_name, tips, settings)
-                with open(model_dir / "prompting.md", 'w', encoding='utf-8') as f:
-                    f.write(prompting_content)
-                files_created.append("prompting.md")
+                prompting_content = self.generate_prompting_md(service_name, tips, settings, now)
+                files["prompting.md"] = prompting_content.encode('utf-8')
             
             # parameters.json
             if settings or cost_info:
-                parameters = self.generate_parameters_json(service_name, settings, cost_info)
-                with open(model_dir / "parameters.json", 'w', encoding='utf-8') as f:
-                    json.dump(parameters, f, indent=2)
-                files_created.append("parameters.json")
+                parameters = self.generate_parameters_json(service_name, settings, cost_info, now)
+                files["parameters.json"] = dumps(parameters, indent=True)
             
             # pitfalls.md - include problems and relevant cost issues
             if problems or any('limit' in c.lower() for c in cost_info):
-                pitfalls_content = self.generate_pitfalls_md(service_name, problems, cost_info)
-                with open(model_dir / "pitfalls.md", 'w', encoding='utf-8') as f:
-                    f.write(pitfalls_content)
-                files_created.append("pitfalls.md")
+                pitfalls_content = self.generate_pitfalls_md(service_name, problems, cost_info, now)
+                files["pitfalls.md"] = pitfalls_content.encode('utf-8')
             
             # cost_optimization.md - money-saving tips
             if cost_info or any('free' in t.lower() or 'unlimited' in t.lower() for t in tips):
-                cost_content = self.generate_cost_optimization_md(service_name, cost_info, tips)
-                with open(model_dir / "cost_optimization.md", 'w', encoding='utf-8') as f:
-                    f.write(cost_content)
-                files_created.append("cost_optimization.md")
+                cost_content = self.generate_cost_optimization_md(service_name, cost_info, tips, now)
+                files["cost_optimization.md"] = cost_content.encode('utf-8')
+            
+            # metadata.json - written last so its content_hash never describes stale files
+            metadata = self.generate_metadata_json(service_name, extraction, content_hash, now)
+            files["metadata.json"] = dumps(metadata, indent=True)
             
-            # metadata.json
-            metadata = self.generate_metadata_json(service_name, extraction)
-            with open(model_dir / "metadata.json", 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
-            files_created.append("metadata.json")
+            self.write_files_atomically(model_dir, files)
+            files_created = list(files)
             
             logger.info(f"Created {len(files_created)} files for {service_name}: {', '.join(files_created)}")
             
-            # Record the update
-            self.update_manager.record_update(
-                service_name, 
+            # Queue the update; flush_updates() writes the log once per batch
+            self._pending_updates.append((
+                service_name,
                 {
                     'tips': tips,
                     'problems': problems,
@@ -304,7 +406,7 @@ class ModelEntryGenerator:
                     'settings': settings
                 },
                 {'files_created': len(files_created)}
-            )
+            ))
             
             return True
             
@@ -312,18 +414,36 @@ class ModelEntryGenerator:
             logger.error(f"Failed to create model entry for {extraction.get('service', 'unknown')}: {e}")
             return False
     
+    def flush_updates(self):
+        """Record all pending updates and save the update log once"""
+        if not self._pending_updates:
+            return
+        
+        with self.update_manager.batch_updates():
+            for service_name, data, stats in self._pending_updates:
+                self.update_manager.record_update(service_name, data, stats)
+        self._pending_updates.clear()
+    
+    def iter_extraction_results(self, results_file: Path):
+        """Yield extraction results, streaming large files when ijson is available"""
+        if ijson is not None and os.path.getsize(results_file) >= STREAMING_THRESHOLD_BYTES:
+            with open(results_file, 'rb', buffering=1024 * 1024) as f:
+                yield from ijson.items(f, 'results.item', use_float=True)
+            return
+        
+        data = loads(Path(results_file).read_bytes())
+        yield from data.get('results', [])
+    
     def process_extraction_results(self, results_file: Path) -> int:
         """Process extraction results and generate model entries"""
         try:
-            with open(results_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            results = data.get('results', [])
+            results_count = 0
             entries_created = 0
             
-            # Merge results by service (case-insensitive)
+            # Merge and deduplicate results by service (case-insensitive) in a single pass
             merged_by_service = {}
-            for result in results:
+            for result in self.iter_extraction_results(results_file):
+                results_count += 1
                 service = result.get('service')
                 if not service:
                     continue
@@ -332,56 +452,56 @@ class ModelEntryGenerator:
                 # Use lowercase as key, but preserve original casing for display
                 service_key = service.lower()
                 
-                if service_key not in merged_by_service:
-                    merged_by_service[service_key] = {
+                bucket = merged_by_service.get(service_key)
+                if bucket is None:
+                    bucket = merged_by_service[service_key] = {
                         'service': service,  # Use first occurrence's casing
-                        'tips': [],
-                        'problems': [],
+                        'tips': set(),
+                        'problems': set(),
                         'settings': [],
-                        'cost_info': [],
+                        'seen_settings': set(),
+                        'cost_info': set(),
                         'batch_size': 0,
                         'timestamp': result.get('timestamp')
                     }
                 
-                # Merge data (handle typos like 'setttings')
-                merged_by_service[service_key]['tips'].extend(result.get('tips', []))
-                merged_by_service[service_key]['problems'].extend(result.get('problems', []))
-                # Handle both 'settings' and 'setttings' (typo from some LLMs)
-                merged_by_service[service_key]['settings'].extend(result.get('settings', []))
-                merged_by_service[service_key]['settings'].extend(result.get('setttings', []))  # Handle typo
-                merged_by_service[service_key]['cost_info'].extend(result.get('cost_info', []))
-                merged_by_service[service_key]['batch_size'] += result.get('batch_size', 0)
-            
-            # Deduplicate and normalize
-            for service, data in merged_by_service.items():
-                # Simple string lists can use set
-                data['tips'] = list(set(data['tips']))
-                data['problems'] = list(set(data['problems']))
-                data['cost_info'] = list(set(data['cost_info']))
+                # Simple string lists go straight into sets so duplicates never accumulate
+                bucket['tips'].update(result.get('tips', ()))
+                bucket['problems'].update(result.get('problems', ()))
+                bucket['cost_info'].update(result.get('cost_info', ()))
+                bucket['batch_size'] += result.get('batch_size', 0)
                 
                 # Settings might contain dicts from local LLMs, need special handling
-                normalized_settings = []
-                seen_settings = set()
-                for setting in data['settings']:
+                # Handle both 'settings' and 'setttings' (typo from some LLMs)
+                settings = bucket['settings']
+                seen_settings = bucket['seen_settings']
+                for setting in (*result.get('settings', ()), *result.get('setttings', ())):
                     if isinstance(setting, dict):
                         # Convert dict to string representation
                         for key, value in setting.items():
                             setting_str = f"{key} = {value}"
                             if setting_str not in seen_settings:
-                                normalized_settings.append(setting_str)
+                                settings.append(setting_str)
                                 seen_settings.add(setting_str)
                     elif isinstance(setting, str):
                         if setting not in seen_settings:
-                            normalized_settings.append(setting)
+                            settings.append(setting)
                             seen_settings.add(setting)
-                data['settings'] = normalized_settings
+            
+            # Materialize lists once for entry generation
+            for data in merged_by_service.values():
+                data['tips'] = list(data['tips'])
+                data['problems'] = list(data['problems'])
+                data['cost_info'] = list(data['cost_info'])
+                del data['seen_settings']
             
             # Create entries
-            for service, extraction in merged_by_service.items():
+            for extraction in merged_by_service.values():
                 if self.create_model_entry(extraction):
                     entries_created += 1
+            self.flush_updates()
             
-            logger.info(f"Created {entries_created} model entries from {len(results)} extraction results")
+            logger.info(f"Created {entries_created} model entries from {results_count} extraction results")
             return entries_created
             
         except Exception as e:
@@ -409,6 +529,7 @@ def test_generator():
     
     # Create entry
     success = generator.create_model_entry(sample_extraction)
+    generator.flush_updates()
     print(f"Created entry: {success}")
     
     # Check created files
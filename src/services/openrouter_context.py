@@ -2,14 +2,42 @@
 OpenRouter Context Window Fetcher - Gets actual context limits from OpenRouter API
 """
 import os
-import json
+import re
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
+from src.utils.fileio import atomic_write_bytes
+from src.utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Conservative context lengths for known model families, in priority order
+_FALLBACK_CONTEXT_LENGTHS = (
+    ("gpt-4-turbo", 128000),
+    ("gpt-4-1106", 128000),
+    ("gpt-4-32k", 32768),
+    ("gpt-4", 8192),
+    ("gpt-3.5-turbo-16k", 16384),
+    ("gpt-3.5", 4096),
+    ("claude-3", 200000),
+    ("claude-2", 100000),
+    ("glm", 128000),
+    ("z-ai", 128000),
+    ("deepseek", 32768),
+    ("mistral", 32768),
+)
+# One lookahead per pattern, tried in list order, so the first listed pattern
+# found anywhere in the name wins (not the leftmost match in the string)
+_FALLBACK_RE = re.compile(
+    "|".join(f"(?=.*?({re.escape(pattern)}))" for pattern, _ in _FALLBACK_CONTEXT_LENGTHS),
+    re.DOTALL,
+)
+
 
 class OpenRouterContextManager:
     """Fetches and caches model context information from OpenRouter"""
@@ -19,7 +47,18 @@ class OpenRouterContextManager:
         self.models_url = "https://openrouter.ai/api/v1/models"
         self.cache = {}
         self.cache_time = None
-        self.cache_duration = timedelta(hours=1)  # Cache for 1 hour
+        self.cache_duration = timedelta(hours=24)  # Context limits rarely change
+        self._etag = None
+        self._refreshing = False
+        self._refresh_lock = threading.Lock()
+        # Lookup tables derived from self.cache, rebuilt whenever it is replaced
+        self._context_lengths: Dict[str, int] = {}
+        self._suffix_index: Dict[str, str] = {}  # "model" -> "provider/model"
+        self._indexed_cache = None
+        
+        # Reuse one pooled connection across refreshes
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
     
     def fetch_models(self) -> Dict[str, Dict]:
         """Fetch model information from OpenRouter API"""
@@ -27,11 +66,18 @@ class OpenRouterContextManager:
             headers = {}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
+            # Conditional GET - only worth it while we still hold the previous payload
+            if self._etag and self.cache:
+                headers["If-None-Match"] = self._etag
             
-            response = requests.get(self.models_url, headers=headers)
+            response = self._session.get(self.models_url, headers=headers)
+            if response.status_code == 304:
+                logger.debug("OpenRouter models unchanged, keeping cached data")
+                return self.cache
             response.raise_for_status()
+            self._etag = response.headers.get("ETag")
             
-            data = response.json()
+            data = loads(response.content)
             models = {}
             
             for model in data.get("data", []):
@@ -50,46 +96,71 @@ class OpenRouterContextManager:
             logger.error(f"Failed to fetch OpenRouter models: {e}")
             return {}
     
+    def _refresh(self):
+        """Refetch models and swap them into the cache"""
+        try:
+            models = self.fetch_models()
+            if models:
+                self.cache = models
+            # Stamp even on failure so an unreachable API isn't retried on every lookup
+            self.cache_time = datetime.now()
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+    
+    def _refresh_in_background(self):
+        """Start a background refresh unless one is already running"""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, daemon=True).start()
+    
+    def _index_cache(self):
+        """Rebuild the flat context-length and suffix tables if self.cache changed"""
+        cache = self.cache
+        if self._indexed_cache is cache:
+            return
+        context_lengths = {}
+        suffix_index = {}
+        for model_id, info in cache.items():
+            context_lengths[model_id] = info["context_length"]
+            suffix_index.setdefault(model_id.rsplit("/", 1)[-1], model_id)
+        self._context_lengths = context_lengths
+        self._suffix_index = suffix_index
+        self._indexed_cache = cache
+    
     def get_context_length(self, model_name: str) -> int:
         """Get context length for a specific model"""
-        # Check if cache is expired or empty
-        if not self.cache or not self.cache_time or \
-           datetime.now() - self.cache_time > self.cache_duration:
+        if not self.cache or not self.cache_time:
             self.cache = self.fetch_models()
             self.cache_time = datetime.now()
+        elif datetime.now() - self.cache_time > self.cache_duration:
+            # Serve stale data now, revalidate without blocking the caller
+            self._refresh_in_background()
+        
+        self._index_cache()
+        context_lengths = self._context_lengths
         
         # Try exact match first
-        if model_name in self.cache:
-            return self.cache[model_name]["context_length"]
+        if model_name in context_lengths:
+            return context_lengths[model_name]
+        
+        # Try provider-prefixed match (e.g., "gpt-4" -> "openai/gpt-4")
+        model_id = self._suffix_index.get(model_name)
+        if model_id is not None:
+            return context_lengths[model_id]
         
-        # Try partial match (e.g., "gpt-4" might match "openai/gpt-4")
-        for model_id, info in self.cache.items():
-            if model_name in model_id or model_id.endswith(f"/{model_name}"):
-                logger.info(f"Found context length for {model_name}: {info['context_length']}")
-                return info["context_length"]
+        # Try partial match (e.g., "gpt-4" might match "openai/gpt-4-0613")
+        for model_id, context_length in context_lengths.items():
+            if model_name in model_id:
+                logger.info(f"Found context length for {model_name}: {context_length}")
+                return context_length
         
         # Fallback to conservative defaults based on known patterns
-        model_lower = model_name.lower()
-        if "gpt-4-turbo" in model_lower or "gpt-4-1106" in model_lower:
-            return 128000
-        elif "gpt-4-32k" in model_lower:
-            return 32768
-        elif "gpt-4" in model_lower:
-            return 8192
-        elif "gpt-3.5-turbo-16k" in model_lower:
-            return 16384
-        elif "gpt-3.5" in model_lower:
-            return 4096
-        elif "claude-3" in model_lower:
-            return 200000
-        elif "claude-2" in model_lower:
-            return 100000
-        elif "glm" in model_lower or "z-ai" in model_lower:
-            return 128000
-        elif "deepseek" in model_lower:
-            return 32768
-        elif "mistral" in model_lower:
-            return 32768
+        match = _FALLBACK_RE.match(model_name.lower())
+        if match:
+            return _FALLBACK_CONTEXT_LENGTHS[match.lastindex - 1][1]
         
         # Default fallback
         logger.warning(f"Unknown model {model_name}, using default context length of 8192")
@@ -109,22 +180,21 @@ class OpenRouterContextManager:
             "models": self.get_all_models(),
             "fetched_at": datetime.now().isoformat()
         }
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        atomic_write_bytes(filepath, dumps(data, indent=True))
         logger.info(f"Saved {len(data['models'])} models to {filepath}")
     
     def load_cache(self, filepath: str = "data/cache/openrouter_models.json") -> bool:
         """Load model cache from file"""
         try:
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                self.cache = data.get("models", {})
-                fetched_str = data.get("fetched_at")
-                if fetched_str:
-                    self.cache_time = datetime.fromisoformat(fetched_str)
-                logger.info(f"Loaded {len(self.cache)} models from cache")
-                return True
+            data = loads(Path(filepath).read_bytes())
+            self.cache = data.get("models", {})
+            fetched_str = data.get("fetched_at")
+            if fetched_str:
+                self.cache_time = datetime.fromisoformat(fetched_str)
+            logger.info(f"Loaded {len(self.cache)} models from cache")
+            return True
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
         return False
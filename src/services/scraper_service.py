@@ -1,5 +1,7 @@
 import asyncio
-from datetime import datetime
+import random
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from src.core.config import settings
@@ -11,6 +13,34 @@ from src.scrapers.source_manager import SourceManager
 
 logger = get_logger(__name__)
 
+# Scheduler retry backoff after a failed run: 5 min, doubling, capped at 1 hour
+_RETRY_BASE_SECONDS = 300
+_RETRY_MAX_SECONDS = 3600
+# Random delay added to every scheduled wait so instances don't fire in lockstep
+_SCHEDULE_JITTER_SECONDS = 60
+
+
+def _reddit_source_id(source: Dict[str, Any]) -> Optional[str]:
+    name = source['name'].split('/')[-1]
+    return f"reddit:{name}"
+
+
+def _github_source_id(source: Dict[str, Any]) -> Optional[str]:
+    url = source.get('url', '')
+    if 'github.com/' in url:
+        repo_path = url.split('github.com/')[-1].rstrip('/')
+        return f"github:{repo_path}"
+    return None
+
+
+# sources.yaml source_type -> scraper source id; SourceType is a str enum, so
+# the raw strings tagged by SourceManager look up directly.
+# News aggregators not yet implemented
+_SOURCE_ID_BUILDERS = {
+    SourceType.REDDIT: _reddit_source_id,
+    SourceType.GITHUB: _github_source_id,
+}
+
 
 class ScraperService:
     """Service for managing the intelligent web scraper."""
@@ -29,28 +59,25 @@ class ScraperService:
             }
         }
         # Practice updater removed - data saved directly by intelligent scraper
+        # The scraper accumulates per-run state, so runs must not overlap
+        self._run_lock = asyncio.Lock()
 
     def _get_default_sources(self, limit: int = 5) -> List[str]:
         """Get default high-priority sources from sources.yaml."""
         default_sources = []
         
+        # Pick up edits to sources.yaml between runs
+        self.source_manager.reload_if_changed()
+        
         # Get high priority sources
         high_priority = self.source_manager.get_sources_by_priority("high")
         
         # Convert to scraper format
         for source in high_priority[:limit]:
-            source_type = source.get('source_type', '')
-            if source_type == 'reddit':
-                name = source['name'].split('/')[-1]
-                default_sources.append(f"reddit:{name}")
-            elif source_type == 'github':
-                url = source.get('url', '')
-                if 'github.com/' in url:
-                    repo_path = url.split('github.com/')[-1].rstrip('/')
-                    default_sources.append(f"github:{repo_path}")
-            # News aggregators not yet implemented
-            # elif source_type == 'news_aggregators':
-            #     default_sources.append("hackernews")
+            build_id = _SOURCE_ID_BUILDERS.get(source.get('source_type'))
+            source_id = build_id(source) if build_id else None
+            if source_id:
+                default_sources.append(source_id)
         
         # Fallback to hardcoded if no high priority sources
         if not default_sources:
@@ -64,51 +91,80 @@ class ScraperService:
         sources: List[str] = None,
         max_posts_per_source: int = 10,
         progress_callback=None,
+        max_concurrency: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Run intelligent scraper on specified sources."""
         
         # Default sources if not specified - use high priority sources from sources.yaml
         if sources is None:
             sources = self._get_default_sources()
+        else:
+            # Drop repeated sources (order-preserving) so nothing is scraped twice
+            sources = list(dict.fromkeys(sources))
         
-        
+        async with self._run_lock:
+            return await self._run_intelligent_scraper(
+                sources, max_posts_per_source, progress_callback, max_concurrency
+            )
+    
+    async def _run_intelligent_scraper(
+        self,
+        sources: List[str],
+        max_posts_per_source: int,
+        progress_callback=None,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run one scrape and update status; callers must hold _run_lock."""
         status = self.scraper_status["intelligent"]
         
         # Update status
+        start_time = datetime.now(timezone.utc)
         status["status"] = "running"
-        status["last_run"] = datetime.utcnow()
+        status["last_run"] = start_time
         status["error"] = None
         
         try:
             logger.info(f"Starting intelligent scraper", sources=sources, max_posts=max_posts_per_source)
             
             # Run the intelligent scraper
-            start_time = datetime.utcnow()
-            await self.intelligent_scraper.scrape_sources(
+            source_errors = await self.intelligent_scraper.scrape_sources(
                 sources=sources,
                 max_posts_per_source=max_posts_per_source,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                max_concurrency=max_concurrency,
             )
-            end_time = datetime.utcnow()
+            end_time = datetime.now(timezone.utc)
             processing_time = (end_time - start_time).total_seconds()
+            errors = [f"{source}: {error}" for source, error in source_errors.items()]
             
-            # Get results from scraper
-            total_posts = len(self.intelligent_scraper.processed_content)
-            total_practices = sum(
-                len(content.best_practices) 
-                for content in self.intelligent_scraper.processed_content
-            )
+            if sources and len(source_errors) == len(sources):
+                logger.error("Intelligent scraper failed for every source", errors=errors)
+                status["status"] = "error"
+                status["error"] = "; ".join(errors)
+                return {
+                    "status": "error",
+                    "source": "intelligent",
+                    "error": status["error"],
+                    "errors": errors,
+                    "processing_time": processing_time,
+                    "timestamp": end_time.isoformat(),
+                    "sources_processed": sources,
+                }
             
-            # Extract all models found
+            # Get results from scraper: practice count and models found in one pass
+            processed_content = self.intelligent_scraper.processed_content
+            total_posts = len(processed_content)
+            total_practices = 0
             all_models = set()
-            for content in self.intelligent_scraper.processed_content:
+            for content in processed_content:
+                total_practices += len(content.best_practices)
                 all_models.update(content.entities.models_mentioned)
             
             # Database operations removed - data is saved directly to model directories
             
             # Update status
             status["status"] = "idle"
-            status["last_success"] = datetime.utcnow()
+            status["last_success"] = end_time
             status["total_runs"] += 1
             status["total_posts"] += total_posts
             
@@ -129,9 +185,9 @@ class ScraperService:
                 "practices_extracted": total_practices,
                 "models_found": sorted(list(all_models)),
                 "processing_time": processing_time,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": end_time.isoformat(),
                 "sources_processed": sources,
-                "errors": []
+                "errors": errors
             }
             
         except Exception as e:
@@ -149,7 +205,7 @@ class ScraperService:
                 "status": "error",
                 "source": "intelligent",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "sources_processed": sources,
             }
 
@@ -164,6 +220,7 @@ class ScraperService:
     async def list_sources(self) -> Dict[str, List[str]]:
         """List available scraping sources from sources.yaml."""
         sources_dict = {}
+        self.source_manager.reload_if_changed()
         
         # Get Reddit sources (functional)
         reddit_sources = self.source_manager.get_reddit_sources()
@@ -178,7 +235,10 @@ class ScraperService:
 
     async def schedule_periodic_scraping(self):
         """Schedule periodic scraping based on configuration."""
+        interval = settings.scraping_interval_hours * 3600
+        failures = 0
         while True:
+            started = time.monotonic()
             try:
                 logger.info("Running scheduled scraping")
                 
@@ -191,15 +251,23 @@ class ScraperService:
                     "github:dair-ai/Prompt-Engineering-Guide"
                 ]
                 
-                await self.run_scrapers(
+                result = await self.run_scrapers(
                     sources=sources,
                     max_posts_per_source=settings.max_posts_per_scrape // len(sources)
                 )
-                
-                # Wait for next run
-                await asyncio.sleep(settings.scraping_interval_hours * 3600)
+                failed = result.get("status") == "error"
                 
             except Exception as e:
                 logger.error("Scheduled scraping failed", error=str(e))
-                # Wait a bit before retrying
-                await asyncio.sleep(300)  # 5 minutes
\ No newline at end of file
+                failed = True
+            
+            if failed:
+                # Back off exponentially while failures persist, never past one interval
+                failures += 1
+                delay = min(_RETRY_BASE_SECONDS * 2 ** min(failures - 1, 8), _RETRY_MAX_SECONDS, interval)
+                logger.info("Retrying scheduled scraping after failure", failures=failures, delay=delay)
+            else:
+                failures = 0
+                # Wait for next run - measured from when this one started so runs don't drift
+                delay = max(0, interval - (time.monotonic() - started))
+            await asyncio.sleep(delay + random.uniform(0, _SCHEDULE_JITTER_SECONDS))
\ No newline at end of file
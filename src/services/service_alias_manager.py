@@ -1,14 +1,31 @@
 """
 Service Alias Manager - Handles service name variations and normalization
 """
-import json
+import functools
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 
+from src.utils.serialization import loads
+
+try:
+    import ahocorasick
+except ImportError:  # Optional: install the 'perf' extra for single-pass text matching
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_NORM_RE = re.compile(r'[^a-z0-9]+')
+_CANONICAL_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Lowercase and strip non-alphanumerics (cached - names repeat across posts)"""
+    return _NORM_RE.sub('', name.lower())
+
 
 class ServiceAliasManager:
     """Manages service name aliases and variations"""
@@ -54,35 +71,38 @@ class ServiceAliasManager:
         self.services = {}
         self.aliases = {}  # Maps any variation to canonical name
         self.reverse_aliases = {}  # Maps canonical to all variations
+        self._canonical_cache: Dict[str, Optional[str]] = {}  # get_canonical_name results
+        self._canonical_to_service: Dict[str, Tuple[str, Dict]] = {}  # canonical -> first (key, data)
         self.load_services()
         self.build_alias_maps()
     
     def load_services(self):
         """Load services from JSON"""
-        if self.services_path.exists():
-            with open(self.services_path, 'r') as f:
-                data = json.load(f)
-                self.services = data.get('services', {})
+        try:
+            with open(self.services_path, 'rb') as f:
+                data = loads(f.read())
+        except FileNotFoundError:
+            return
+        self.services = data.get('services', {})
     
     def build_alias_maps(self):
         """Build comprehensive alias mappings"""
+        self._canonical_cache.clear()
         # First, add known variations
         for canonical, variations in self.VARIATION_PATTERNS:
             self.reverse_aliases[canonical] = set(variations)
-            for variation in variations:
-                self.aliases[variation.lower()] = canonical
-                self.aliases[self.normalize_name(variation)] = canonical
+        norm_to_canonical = {}  # First pattern wins, as in pattern order
+        for canonical, variation_lower, variation_norm in _VARIATIONS_FLAT:
+            self.aliases[variation_lower] = canonical
+            self.aliases[variation_norm] = canonical
+            norm_to_canonical.setdefault(variation_norm, canonical)
         
         # Then add variations from services.json
         for service_key, service_data in self.services.items():
             display_name = service_data.get('display_name', '')
             
             # Find if this matches any known pattern
-            matched_canonical = None
-            for canonical, variations in self.VARIATION_PATTERNS:
-                if any(self.normalize_name(display_name) == self.normalize_name(v) for v in variations):
-                    matched_canonical = canonical
-                    break
+            matched_canonical = norm_to_canonical.get(self.normalize_name(display_name))
             
             if matched_canonical:
                 # Add this service key as an alias
@@ -97,16 +117,33 @@ class ServiceAliasManager:
                 self.aliases[display_name.lower()] = canonical
                 self.aliases[self.normalize_name(display_name)] = canonical
                 self.reverse_aliases[canonical] = {service_key, display_name, display_name.lower()}
+        
+        # Index services by canonical name once the aliases are complete
+        self._canonical_to_service = {}
+        for service_key, service_data in self.services.items():
+            canonical = self.get_canonical_name(service_key)
+            if canonical and canonical not in self._canonical_to_service:
+                self._canonical_to_service[canonical] = (service_key, service_data)
     
     def normalize_name(self, name: str) -> str:
         """Normalize a service name for matching"""
         # Remove special characters and normalize spacing
-        normalized = name.lower()
-        normalized = re.sub(r'[^a-z0-9]+', '', normalized)
-        return normalized
+        return _normalize_name(name)
     
     def get_canonical_name(self, name: str) -> Optional[str]:
         """Get the canonical name for any variation"""
+        try:
+            return self._canonical_cache[name]
+        except KeyError:
+            pass
+        canonical = self._resolve_canonical_name(name)
+        if len(self._canonical_cache) >= _CANONICAL_CACHE_SIZE:
+            self._canonical_cache.clear()
+        self._canonical_cache[name] = canonical
+        return canonical
+    
+    def _resolve_canonical_name(self, name: str) -> Optional[str]:
+        """Uncached lookup behind get_canonical_name"""
         name_lower = name.lower()
         
         # Try exact match first
@@ -119,10 +156,9 @@ class ServiceAliasManager:
             return self.aliases[normalized]
         
         # Try partial matching for common services
-        for canonical, variations in self.VARIATION_PATTERNS:
-            for variation in variations:
-                if name_lower in variation.lower() or variation.lower() in name_lower:
-                    return canonical
+        for canonical, variation_lower, _ in _VARIATIONS_FLAT:
+            if name_lower in variation_lower or variation_lower in name_lower:
+                return canonical
         
         return None
     
@@ -133,9 +169,9 @@ class ServiceAliasManager:
             canonical = canonical_or_alias
         
         # Look for the service in our data
-        for service_key, service_data in self.services.items():
-            if self.get_canonical_name(service_key) == canonical:
-                return service_data.get('display_name', canonical_or_alias)
+        entry = self._canonical_to_service.get(canonical)
+        if entry:
+            return entry[1].get('display_name', canonical_or_alias)
         
         # Fallback to the canonical name with proper casing
         for pattern_canonical, variations in self.VARIATION_PATTERNS:
@@ -155,14 +191,21 @@ class ServiceAliasManager:
     
     def find_service_in_text(self, text: str) -> List[str]:
         """Find all service mentions in a text"""
-        found_services = set()
         text_lower = text.lower()
         
-        for canonical, variations in self.VARIATION_PATTERNS:
-            for variation in variations:
-                if variation.lower() in text_lower:
-                    found_services.add(canonical)
-                    break
+        # One pass over the text regardless of how many variations there are;
+        # only whole-word mentions count ('did' in "didn't" is not D-ID)
+        if _VARIATION_AUTOMATON is not None:
+            found_services = {
+                canonical
+                for end, (canonical, length) in _VARIATION_AUTOMATON.iter(text_lower)
+                if _is_whole_word(text_lower, end - length + 1, end + 1)
+            }
+        else:
+            found_services = {
+                _VARIATION_TO_CANONICAL[match.group(0)]
+                for match in _VARIATION_RE.finditer(text_lower)
+            }
         
         return list(found_services)
     
@@ -173,15 +216,16 @@ class ServiceAliasManager:
             return None
         
         # Find the service data
-        for service_key, service_data in self.services.items():
-            if self.get_canonical_name(service_key) == canonical:
-                return {
-                    'canonical': canonical,
-                    'display_name': service_data.get('display_name', query),
-                    'category': service_data.get('category', 'general'),
-                    'service_key': service_key,
-                    'all_variations': list(self.get_all_variations(query))
-                }
+        entry = self._canonical_to_service.get(canonical)
+        if entry:
+            service_key, service_data = entry
+            return {
+                'canonical': canonical,
+                'display_name': service_data.get('display_name', query),
+                'category': service_data.get('category', 'general'),
+                'service_key': service_key,
+                'all_variations': list(self.get_all_variations(query))
+            }
         
         # If not in services.json, still return what we know
         return {
@@ -193,6 +237,76 @@ class ServiceAliasManager:
         }
 
 
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is a whole word (same boundaries as the regex path)"""
+    return (
+        (start == 0 or not _is_word_char(text[start - 1]))
+        and (end == len(text) or not _is_word_char(text[end]))
+    )
+
+
+def _build_variation_table() -> Dict[str, str]:
+    """Lowercased variation -> canonical name (first pattern wins)"""
+    table = {}
+    for canonical, variation_lower, _ in _VARIATIONS_FLAT:
+        table.setdefault(variation_lower, canonical)
+    return table
+
+
+def _build_variation_automaton():
+    """Aho-Corasick automaton mapping lowercased variations to (canonical, length)"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for variation, canonical in _VARIATION_TO_CANONICAL.items():
+        automaton.add_word(variation, (canonical, len(variation)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_variation_regex() -> re.Pattern:
+    """Whole-word regex over all lowercased variations, factored into a prefix trie
+
+    Shared prefixes keep the engine from retrying every alternative at each
+    position; longer variations are tried before their prefixes.
+    """
+    trie = {}
+    for variation in _VARIATION_TO_CANONICAL:
+        node = trie
+        for char in variation:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def emit(node):
+        alternatives = [re.escape(char) + emit(child) for char, child in node.items() if char]
+        if '' in node:
+            alternatives.append('')  # A variation ends here
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+    
+    return re.compile(r'\b(?:' + emit(trie) + r')\b')
+
+
+# (canonical, lowercased, normalized) per variation in pattern order, built once
+# for all managers; strings are interned since the same few recur in every lookup
+_VARIATIONS_FLAT: Tuple[Tuple[str, str, str], ...] = tuple(
+    (sys.intern(canonical), sys.intern(variation.lower()), sys.intern(_normalize_name(variation)))
+    for canonical, variations in ServiceAliasManager.VARIATION_PATTERNS
+    for variation in variations
+)
+
+_VARIATION_TO_CANONICAL = _build_variation_table()
+
+_VARIATION_AUTOMATON = _build_variation_automaton()
+# Used when pyahocorasick isn't installed
+_VARIATION_RE = _build_variation_regex()
+
+
 def test_alias_manager():
     """Test the alias manager"""
     manager = ServiceAliasManager()
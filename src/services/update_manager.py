@@ -1,16 +1,29 @@
 """
 Update Manager - Handles incremental updates and git-friendly changes
 """
-import json
+import functools
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta
 import hashlib
 import logging
 
+from src.utils.fileio import atomic_write_bytes
+from src.utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
+# Content fields covered by calculate_content_hash, in hashing order
+_HASHED_FIELDS = ("cost_info", "problems", "settings", "tips")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ts(timestamp: str) -> datetime:
+    """Parse an update log timestamp (cached - every scan re-reads the same strings)"""
+    return datetime.fromisoformat(timestamp)
+
 
 class UpdateManager:
     """Manages updates to model entries with git-friendly practices"""
@@ -19,22 +32,44 @@ class UpdateManager:
         self.models_root = models_root
         self.update_log_path = Path("data/intermediate/update_log.json")
         self.update_log = self.load_update_log()
+        self._batch_depth = 0  # > 0 while inside batch_updates()
+        # (oldest, newest) service timestamp, kept current by record_update; None = rebuild on read
+        self._ts_bounds: Optional[Tuple[datetime, datetime]] = None
     
     def load_update_log(self) -> Dict:
         """Load the update log tracking what's been extracted"""
-        if self.update_log_path.exists():
-            with open(self.update_log_path, 'r') as f:
-                return json.load(f)
+        try:
+            return loads(self.update_log_path.read_bytes())
+        except FileNotFoundError:
+            pass
         return {
             "services": {},
             "last_update": None
         }
     
     def save_update_log(self):
-        """Save the update log"""
+        """Save the update log (compact - it's machine-written; see dump_pretty)"""
         self.update_log_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.update_log_path, 'w') as f:
-            json.dump(self.update_log, f, indent=2)
+        atomic_write_bytes(self.update_log_path, dumps(self.update_log))
+    
+    def dump_pretty(self) -> str:
+        """Indented update log for human inspection"""
+        return dumps(self.update_log, indent=True).decode('utf-8')
+    
+    @contextmanager
+    def batch_updates(self):
+        """Defer update log writes from record_update() and save once on exit
+        
+        The log is still written via temp file + rename, but without fsync, so a
+        batch costs one small write no matter how many services it records.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.save_update_log()
     
     def should_update_service(self, service_name: str, new_data: Dict) -> bool:
         """
@@ -53,7 +88,7 @@ class UpdateManager:
         last_update = self.update_log["services"][service_key]
         
         # Check if enough time has passed (e.g., 7 days)
-        last_date = datetime.fromisoformat(last_update["timestamp"])
+        last_date = _parse_ts(last_update["timestamp"])
         days_since = (datetime.now() - last_date).days
         if days_since > 7:
             logger.info(f"{service_name} hasn't been updated in {days_since} days, will update")
@@ -98,11 +133,16 @@ class UpdateManager:
         return new_data
     
     def record_update(self, service_name: str, data: Dict, extraction_stats: Dict = None):
-        """Record that a service was updated"""
+        """Record that a service was updated
+        
+        Inside batch_updates() the log is only written when the batch ends.
+        """
         service_key = service_name.lower().replace(' ', '-')
+        now = datetime.now()
+        previous = self.update_log["services"].get(service_key)
         
         self.update_log["services"][service_key] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "content_counts": {
                 "tips": len(data.get("tips", [])),
                 "problems": len(data.get("problems", [])),
@@ -112,20 +152,30 @@ class UpdateManager:
             "extraction_stats": extraction_stats or {},
             "content_hash": self.calculate_content_hash(data)
         }
-        self.update_log["last_update"] = datetime.now().isoformat()
-        self.save_update_log()
+        self.update_log["last_update"] = now.isoformat()
+        
+        if self._ts_bounds is not None:
+            oldest, newest = self._ts_bounds
+            if previous is not None and _parse_ts(previous["timestamp"]) == oldest:
+                self._ts_bounds = None  # Replaced the oldest entry; rescan lazily
+            else:
+                self._ts_bounds = (oldest, max(newest, now))
+        
+        if not self._batch_depth:
+            self.save_update_log()
     
     def calculate_content_hash(self, data: Dict) -> str:
         """Calculate a hash of the content for change detection"""
-        # Sort and serialize the content for consistent hashing
-        content = {
-            "tips": sorted(data.get("tips", [])),
-            "problems": sorted(data.get("problems", [])),
-            "cost_info": sorted(data.get("cost_info", [])),
-            "settings": sorted(data.get("settings", []))
-        }
-        content_str = json.dumps(content, sort_keys=True)
-        return hashlib.md5(content_str.encode()).hexdigest()
+        # Feed each field's items in sorted order straight into the hash; items are
+        # length-prefixed so different splits of the same text can't collide
+        digest = hashlib.blake2b(digest_size=16)
+        for field in _HASHED_FIELDS:
+            digest.update(field.encode() + b"\0")
+            for item in sorted(data.get(field, [])):
+                encoded = item.encode("utf-8")
+                digest.update(b"%d:" % len(encoded))
+                digest.update(encoded)
+        return digest.hexdigest()
     
     def generate_update_summary(self) -> str:
         """Generate a summary of recent updates for git commit messages"""
@@ -133,12 +183,10 @@ class UpdateManager:
             return "Initial extraction"
         
         # Find services updated in this session
-        now = datetime.now()
         recent_updates = []
         
-        for service, info in self.update_log["services"].items():
-            update_time = datetime.fromisoformat(info["timestamp"])
-            if (now - update_time).seconds < 3600:  # Within last hour
+        for service, age, info in self._scan_services():
+            if age.total_seconds() < 3600:  # Within last hour
                 counts = info["content_counts"]
                 total = sum(counts.values())
                 recent_updates.append(f"{service} ({total} items)")
@@ -149,15 +197,7 @@ class UpdateManager:
     
     def get_stale_services(self, days: int = 30) -> List[str]:
         """Get list of services that haven't been updated recently"""
-        stale = []
-        cutoff = datetime.now()
-        
-        for service, info in self.update_log.get("services", {}).items():
-            update_time = datetime.fromisoformat(info["timestamp"])
-            if (cutoff - update_time).days > days:
-                stale.append(service)
-        
-        return stale
+        return [service for service, age, _ in self._scan_services() if age.days > days]
     
     def get_update_status(self) -> Dict:
         """Get overall update status for monitoring"""
@@ -169,13 +209,12 @@ class UpdateManager:
                 "recent_updates": []
             }
         
-        now = datetime.now()
+        scan = self._scan_services()
         recent = []
         stale = []
         
-        for service, info in self.update_log["services"].items():
-            update_time = datetime.fromisoformat(info["timestamp"])
-            days_ago = (now - update_time).days
+        for service, age, _ in scan:
+            days_ago = age.days
             
             if days_ago < 7:
                 recent.append(service)
@@ -192,25 +231,36 @@ class UpdateManager:
     
     def calculate_update_frequency(self) -> str:
         """Calculate how often updates are happening"""
-        if not self.update_log.get("services"):
+        services = self.update_log.get("services")
+        if not services:
             return "No updates yet"
         
-        timestamps = [
-            datetime.fromisoformat(info["timestamp"])
-            for info in self.update_log["services"].values()
-        ]
-        
-        if len(timestamps) < 2:
+        if len(services) < 2:
             return "Single update"
         
-        timestamps.sort()
-        total_span = (timestamps[-1] - timestamps[0]).days
+        oldest, newest = self._timestamp_bounds()
+        total_span = (newest - oldest).days
         
         if total_span == 0:
             return "All updated today"
         
-        avg_days = total_span / len(timestamps)
+        avg_days = total_span / len(services)
         return f"Average {avg_days:.1f} days between updates"
+    
+    def _timestamp_bounds(self) -> Tuple[datetime, datetime]:
+        """Oldest and newest service timestamps; only rescans after an invalidation"""
+        if self._ts_bounds is None:
+            timestamps = [_parse_ts(info["timestamp"]) for info in self.update_log["services"].values()]
+            self._ts_bounds = (min(timestamps), max(timestamps))
+        return self._ts_bounds
+    
+    def _scan_services(self) -> List[Tuple[str, timedelta, Dict]]:
+        """One pass over the log: (service, time since its update, entry) per service"""
+        now = datetime.now()
+        return [
+            (service, now - _parse_ts(info["timestamp"]), info)
+            for service, info in self.update_log.get("services", {}).items()
+        ]
 
 
 def test_update_manager():
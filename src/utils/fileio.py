@@ -0,0 +1,30 @@
+"""
+File helpers - crash-safe writes for JSON caches and logs
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Union
+
+# Process umask, read once so temp files can get the mode a plain open() would give
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes):
+    """Write data to path via a unique sibling temp file and os.replace
+
+    Readers see either the old file or the complete new one, never a partial write,
+    and concurrent writers to the same path never share a temp file.
+    """
+    path = Path(path)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        tmp_path.write_bytes(data)
+        # NamedTemporaryFile creates 0600 files; match a regular write instead
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
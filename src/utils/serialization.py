@@ -0,0 +1,45 @@
+"""
+JSON serialization helpers - uses orjson when installed, stdlib json otherwise
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional: install the 'perf' extra for faster (de)serialization
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types JSON can't represent natively"""
+    # Match orjson's native datetime/date output
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent when indent=True)
+
+    Datetimes are written in ISO format; other unsupported objects raise TypeError.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False, default=_default)
+    return text.encode('utf-8')